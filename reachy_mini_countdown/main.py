@@ -5,22 +5,150 @@ New Year's Eve or any celebration!
 
 import argparse
 import base64
-import io
+import collections
+import enum
+import functools
+import gzip
+import hashlib
+import json
+import logging
 import os
+import queue
+import shutil
 import subprocess
 import sys
 import threading
 import time
-from datetime import datetime, timedelta
+import wave
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
 from pathlib import Path
+from typing import NamedTuple
 
-from flask import Flask, Response, render_template_string
+from flask import Flask, Response, render_template
 import cv2
 import numpy as np
 
 from reachy_mini import ReachyMini, ReachyMiniApp
 from reachy_mini.utils import create_head_pose
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Local audio tools (Linux), resolved once instead of probing with failing Popen calls
+_MUSIC_PLAYER = next((p for p in ('paplay', 'aplay', 'mpg123', 'ffplay') if shutil.which(p)), None)
+_FFPLAY = shutil.which('ffplay')
+_LINUX_TTS = next((t for t in ('espeak', 'festival') if shutil.which(t)), None)
+if sys.platform == 'darwin':
+    _WAV_PLAYER: list[str] | None = ['afplay']
+elif sys.platform.startswith('linux'):
+    _WAV_PLAYER = ['aplay', '-q']
+else:
+    _WAV_PLAYER = None
+
+
+@functools.lru_cache(maxsize=128)
+def _head_pose(roll: float = 0, pitch: float = 0, yaw: float = 0):
+    """Cached create_head_pose() in degrees; callers must not mutate the result."""
+    return create_head_pose(roll=roll, pitch=pitch, yaw=yaw, degrees=True)
+
+
+@functools.lru_cache(maxsize=1)
+def _midnight_after(day: date) -> datetime:
+    """Local midnight at the end of the given day."""
+    return datetime(day.year, day.month, day.day) + timedelta(days=1)
+
+
+class Command(enum.IntEnum):
+    """Control commands sent from the web UI to the countdown loop."""
+
+    START = 1
+    STOP = 2
+    RESET = 3
+
+
+@dataclass
+class ControlState:
+    """Settings shared between the web UI and the countdown loop.
+
+    Hold ``lock`` for read-modify-write sequences that touch several fields.
+    """
+
+    running: bool = False
+    seconds: int = 30
+    youtube_url: str | None = None
+    speak_intervals: bool = True
+    easter_egg: bool = False
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def set_running(self, running: bool) -> None:
+        with self.lock:
+            self.running = running
+
+
+def _format_hms(remaining: float) -> str:
+    """Format seconds as HH:MM:SS for the web UI."""
+    hours = int(remaining // 3600)
+    minutes = int((remaining % 3600) // 60)
+    seconds = int(remaining % 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+
+class Snapshot(NamedTuple):
+    """Countdown progress as one immutable value."""
+
+    remaining: float = 0
+    formatted: str = '00:00:00'
+    target: str = ''
+
+
+class CountdownState:
+    """Countdown progress published by the countdown loop for the web UI.
+
+    Writers replace the whole Snapshot under the lock, so a reader takes a
+    single consistent (remaining, target) pair without holding it. Every
+    change bumps ``version`` and wakes wait_changed() callers.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._snapshot = Snapshot()
+        self.version = 0
+
+    def snapshot(self) -> Snapshot:
+        with self._lock:
+            return self._snapshot
+
+    def update(self, remaining: float | None = None, target: str | None = None) -> None:
+        with self._lock:
+            snap = self._snapshot
+            if remaining is not None:
+                # Formatted once here rather than per /countdown request
+                snap = snap._replace(remaining=remaining, formatted=_format_hms(remaining))
+            if target is not None:
+                snap = snap._replace(target=target)
+            self._snapshot = snap
+            self.version += 1
+            self._changed.notify_all()
+
+    def notify(self) -> None:
+        """Wake waiters for a change kept elsewhere (e.g. ControlState.running)."""
+        with self._lock:
+            self.version += 1
+            self._changed.notify_all()
+
+    def wait_changed(self, version: int, timeout: float) -> int:
+        """Block until the state moves past version, or timeout; returns the current version."""
+        with self._changed:
+            self._changed.wait_for(lambda: self.version != version, timeout)
+            return self.version
+
 
 class ReachyMiniCountdown(ReachyMiniApp):
     """Countdown app with celebration dance at zero."""
@@ -31,9 +159,25 @@ class ReachyMiniCountdown(ReachyMiniApp):
     emoji: str = "🎉"
     
     CELEBRATION_DURATION = 60
+    # Announcements not started within this many seconds are skipped
+    ANNOUNCEMENT_MAX_DELAY = 0.8
     # Classic "Auld Lang Syne" - traditional New Year's song
     AULD_LANG_SYNE_URL = "https://www.youtube.com/watch?v=Al7ONqrdscY&t=3s"
     _easter_egg_activated = False  # 🥚 Easter egg state
+    # Fixed head poses used by the animations: name -> (roll, pitch, yaw) in degrees
+    HEAD_POSES = {
+        'rest': (0, -30, 0),
+        'spin_left': (15, -35, -20),
+        'spin_right': (-15, -35, 20),
+        'victory': (0, -45, 0),
+        'dance_left': (10, -30, -15),
+        'dance_right': (-10, -30, 15),
+        'big_move': (0, -40, 0),
+        'egg_spin_left': (20, -40, -30),
+        'egg_spin_right': (-20, -40, 30),
+        'egg_victory_left': (10, -50, 0),
+        'egg_victory_right': (-10, -50, 0),
+    }
 
     def __init__(
         self,
@@ -49,186 +193,271 @@ class ReachyMiniCountdown(ReachyMiniApp):
         # Track any local audio processes to stop them cleanly
         self._audio_procs: list[subprocess.Popen] = []
         self._audio_stop_event: threading.Event | None = None
+        # Serializes celebration music downloads (files are cached on disk by URL)
+        self._youtube_audio_lock = threading.Lock()
         # Pre-generated countdown audio files
         self._countdown_audio_files: dict[int, str] = {}
+        # play_sound bound to each of those files, once run() has the robot
+        self._countdown_calls: dict[int, functools.partial] = {}
         self._pre_generate_countdown_audio()
+        # Local TTS fallback for this platform, picked once
+        if sys.platform == 'darwin':
+            self._speak_local = self._speak_macos
+        elif sys.platform.startswith('linux'):
+            # In-process espeak via pyttsx3 when installed; subprocess otherwise
+            self._tts = self._init_tts()
+            self._tts_lock = threading.Lock()
+            self._speak_local = self._speak_linux if self._tts is None else self._speak_countdown_tts
+        else:
+            self._speak_local = self._speak_windows
+        # Head poses are built once here instead of on every animation beat
+        self._poses = {
+            name: _head_pose(roll, pitch, yaw)
+            for name, (roll, pitch, yaw) in self.HEAD_POSES.items()
+        }
+        self._final_minute_table: list[tuple[float, object]] = []
+        # Control commands from the web UI, delivered to run() without polling
+        self._cmd_cond = threading.Condition()
+        self._cmd_queue: collections.deque[tuple[Command, int | None]] = collections.deque()
+        # Shared with the web UI when started via main(); None under the dashboard
+        self._countdown_state: CountdownState | None = None
+        self._control_state: ControlState | None = None
+        self._total_countdown: float = 60
+        # Last number announced in the final ten, so each is spoken once
+        self._last_spoken: int = -1
+        self._primed = False
+        # Countdown announcements (number, robot, monotonic time queued) are
+        # spoken by one long-lived worker thread
+        self._announcements: queue.SimpleQueue[tuple[int, ReachyMini, float]] = queue.SimpleQueue()
+        threading.Thread(target=self._announcer, daemon=True).start()
+
+    def post_command(self, action: Command, seconds: int | None = None) -> None:
+        """Queue a control command and wake run()."""
+        with self._cmd_cond:
+            self._cmd_queue.append((action, seconds))
+            self._cmd_cond.notify_all()
+
+    def _next_command(self, stop_event: threading.Event, timeout: float) -> tuple[Command, int | None] | None:
+        """Block until a command arrives (or timeout / stop) and pop it."""
+        with self._cmd_cond:
+            self._cmd_cond.wait_for(lambda: self._cmd_queue or stop_event.is_set(), timeout=timeout)
+            if self._cmd_queue:
+                return self._cmd_queue.popleft()
+        return None
+
+    def _wait_for_command(self, stop_event: threading.Event, timeout: float) -> None:
+        """Sleep for up to timeout seconds, returning early if a command arrives."""
+        with self._cmd_cond:
+            self._cmd_cond.wait_for(lambda: self._cmd_queue or stop_event.is_set(), timeout=timeout)
+
+    def _await_start(self, reachy: ReachyMini, stop_event: threading.Event) -> int | None:
+        """Wait for a start command from the web UI.
+
+        Resets are applied while waiting and stops are ignored. Returns the
+        requested duration in seconds (0 if unspecified), or None once
+        stop_event is set.
+        """
+        while not stop_event.is_set():
+            command = self._next_command(stop_event, timeout=1.0)
+            if command is None:
+                continue
+            action, seconds = command
+            if action is Command.START:
+                return seconds or 0
+            if action is Command.RESET:
+                self._control_state.set_running(False)
+                self._countdown_state.update(remaining=0)
+                self._reset_pose(reachy)
+        return None
+
+    def _begin_countdown(self, seconds: int | None) -> datetime:
+        """Mark a web UI countdown as running and return its target time."""
+        control_state = self._control_state
+        # Same lock as the web handlers, so seconds and running change together
+        with control_state.lock:
+            seconds = seconds or control_state.seconds
+            control_state.running = True
+        self._set_total_countdown(seconds)  # Store for antenna sweep
+        self._last_spoken = -1
+        print(f"🎊 Starting {seconds} second countdown!")
+        return datetime.now() + timedelta(seconds=seconds)
+
+    def _wait_for_start(self, reachy: ReachyMini, stop_event: threading.Event) -> datetime | None:
+        """Wait for a start command and begin that countdown; None once stopped."""
+        seconds = self._await_start(reachy, stop_event)
+        if seconds is None:
+            return None
+        return self._begin_countdown(seconds)
 
     def run(self, reachy_mini: ReachyMini, stop_event: threading.Event):
         """Main entry point - called by dashboard."""
         # Get shared state if available (set by main())
-        countdown_state = getattr(self, '_countdown_state', None)
-        control_state = getattr(self, '_control_state', None)
+        countdown_state = self._countdown_state
+        control_state = self._control_state
         audio_stop = None
         
         # Start with a gentle reset pose - ensure head is up high
         # Stop audio if running
         if audio_stop is None:
-            audio_stop = getattr(self, "_audio_stop_event", None)
+            audio_stop = self._audio_stop_event
         self._stop_audio_playback(reachy_mini, audio_stop)
+        self._bind_audio(reachy_mini)
+        self._prime_audio(reachy_mini)
+        started = time.monotonic()
         self._reset_pose(reachy_mini)
-        time.sleep(1.0)  # Give more time for head to move up
-        
-        # Double-check head is up high
-        head = create_head_pose(yaw=0, pitch=-30, roll=0, degrees=True)
-        reachy_mini.goto_target(head=head, duration=0.8)
-        time.sleep(0.5)
+        # Let the 0.8 s move finish, without adding a fixed wait on top of it
+        time.sleep(max(0.0, 0.8 - (time.monotonic() - started)))
         
         # Wait for start command if control_state exists
-        self._last_spoken = -1  # Track which countdown numbers have been spoken
-        self._total_countdown = 30  # Total countdown duration for antenna sweep
+        self._set_total_countdown(30)  # Total countdown duration for antenna sweep
         if control_state is not None:
-            # Default speak_intervals to True if not set
-            if 'speak_intervals' not in control_state:
-                control_state['speak_intervals'] = True
-            while not stop_event.is_set():
-                action = control_state.get('action')
-                if action == 'start':
-                    seconds = control_state.get('seconds', 30)
-                    self._total_countdown = seconds  # Store for antenna sweep
-                    target = datetime.now() + timedelta(seconds=seconds)
-                    control_state['action'] = None  # Clear action
-                    control_state['running'] = True
-                    self._last_spoken = -1
-                    print(f"🎊 Starting {seconds} second countdown!")
-                    break
-                elif action == 'reset':
-                    control_state['action'] = None
-                    control_state['running'] = False
-                    countdown_state['remaining'] = 0
-                    self._reset_pose(reachy_mini)
-                time.sleep(0.5)
+            target = self._wait_for_start(reachy_mini, stop_event)
+            if target is None:
+                self._reset_pose(reachy_mini)
+                return
         else:
             # Default behavior - use target override or midnight
             target = self._target_override or self._get_next_midnight()
-            self._total_countdown = (target - datetime.now()).total_seconds()
+            self._set_total_countdown((target - datetime.now()).total_seconds())
             print(f"🎊 Countdown to: {target}")
 
+        # The tick runs on the monotonic clock; the wall-clock target is only
+        # converted (and formatted for the UI) when it changes.
+        armed_target = None
+        deadline_ns = 0
         while not stop_event.is_set():
-            # Check for stop command
+            # Check for control commands (non-blocking)
             if control_state is not None:
-                if control_state.get('action') == 'stop':
-                    control_state['action'] = None
-                    control_state['running'] = False
-                    print("⏹️ Countdown stopped")
-                    self._reset_pose(reachy_mini)
-                    # Wait for new start command
-                    while not stop_event.is_set():
-                        action = control_state.get('action')
-                        if action == 'start':
-                            seconds = control_state.get('seconds', 30)
-                            self._total_countdown = seconds
-                            target = datetime.now() + timedelta(seconds=seconds)
-                            control_state['action'] = None
-                            control_state['running'] = True
-                            self._last_spoken = -1
-                            print(f"🎊 Starting {seconds} second countdown!")
-                            break
-                        elif action == 'reset':
-                            control_state['action'] = None
-                            control_state['running'] = False
-                            countdown_state['remaining'] = 0
-                            self._reset_pose(reachy_mini)
-                        time.sleep(0.5)
-                    continue
-                elif control_state.get('action') == 'reset':
-                    control_state['action'] = None
-                    control_state['running'] = False
-                    countdown_state['remaining'] = 0
+                command = self._next_command(stop_event, timeout=0)
+                action, seconds = command if command is not None else (None, None)
+                if action is Command.START:
+                    # Restart with the new duration
+                    target = self._begin_countdown(seconds)
+                elif action is not None:
+                    # Stop or reset: back to ready until the next start
+                    control_state.set_running(False)
+                    if action is Command.STOP:
+                        print("⏹️ Countdown stopped")
+                    else:
+                        countdown_state.update(remaining=0)
                     self._reset_pose(reachy_mini)
-                    target = datetime.now() + timedelta(seconds=30)  # Default 30s
+                    target = self._wait_for_start(reachy_mini, stop_event)
+                    if target is None:
+                        break
                     continue
             
-            remaining = (target - datetime.now()).total_seconds()
+            if target != armed_target:
+                armed_target = target
+                self._last_spoken = -1
+                deadline_ns = time.monotonic_ns() + int((target - datetime.now()).total_seconds() * 1e9)
+                if countdown_state is not None:
+                    countdown_state.update(target=str(target))
+                # Fetch the celebration music now rather than at zero
+                threading.Thread(
+                    target=self._prefetch_audio,
+                    args=(self._celebration_audio_url(),),
+                    daemon=True
+                ).start()
+            remaining_ns = deadline_ns - time.monotonic_ns()
+            remaining = remaining_ns / 1e9
             
             # Update shared state for web UI
             if countdown_state is not None:
-                countdown_state['remaining'] = remaining
-                countdown_state['target'] = str(target)
+                countdown_state.update(remaining=remaining)
 
             if remaining <= 0:
                 self._celebrate(reachy_mini, stop_event)
+                # Re-arm even if the next target is the same value (e.g. the
+                # monotonic deadline beat a wall clock stepped back by NTP)
+                armed_target = None
                 if self._once:
                     break
                 # Check if we should continue or wait for new start
                 if control_state is not None:
-                    control_state['running'] = False
-                    # Wait for new start command
-                    while not stop_event.is_set():
-                        action = control_state.get('action')
-                        if action == 'start':
-                            seconds = control_state.get('seconds', 30)
-                            self._total_countdown = seconds
-                            target = datetime.now() + timedelta(seconds=seconds)
-                            control_state['action'] = None
-                            control_state['running'] = True
-                            self._last_spoken = -1
-                            print(f"🎊 Starting {seconds} second countdown!")
-                            break
-                        time.sleep(0.5)
+                    control_state.set_running(False)
+                    target = self._wait_for_start(reachy_mini, stop_event)
+                    if target is None:
+                        break
                     continue
-                target = self._get_next_midnight() if self._target_override is None else self._target_override
+                # The midnight after the one just celebrated, whatever the wall clock says
+                target = _midnight_after(target.date()) if self._target_override is None else self._target_override
             elif remaining <= 10:
                 # Countdown from 10 to 1
                 countdown_number = int(remaining)
-                if countdown_number > 0 and countdown_number != getattr(self, '_last_spoken', -1):
+                if countdown_number > 0 and countdown_number != self._last_spoken:
                     self._last_spoken = countdown_number
                     self._final_ten(reachy_mini, countdown_number)
-                # Sleep shorter to catch each second
-                time.sleep(0.1)
+                # Wake just after the next whole second (or on a command)
+                self._wait_for_command(stop_event, self._until_next_second(deadline_ns))
             elif remaining <= 60:
                 self._final_minute(reachy_mini, int(remaining))
-                time.sleep(1)
+                self._wait_for_command(stop_event, self._until_next_second(deadline_ns))
             else:
-                # Keep head up during idle
-                head = create_head_pose(pitch=-30, degrees=True)
-                reachy_mini.goto_target(head=head, duration=0.3)
+                # Keeps the head up too (rest pose sent with the antenna move)
                 self._waiting_idle(reachy_mini)
-                time.sleep(5)
+                # Coarse idle wait, but never past the start of the final minute
+                self._wait_for_command(stop_event, min(5.0, remaining - 60 + 0.001))
 
         self._reset_pose(reachy_mini)
 
+    @staticmethod
+    def _until_next_second(deadline_ns: int) -> float:
+        """Seconds until the time left before deadline_ns drops to the next whole second."""
+        return (deadline_ns - time.monotonic_ns()) % 1_000_000_000 / 1e9 + 0.001
+
+    def _set_total_countdown(self, total: float) -> None:
+        """Store the countdown length and precompute the final-minute sweep table."""
+        self._total_countdown = total
+        self._final_minute_table = []
+        if total > 0:
+            self._final_minute_table = [
+                self._sweep_step(s, total) for s in range(int(min(total, 60)) + 1)
+            ]
+
+    @staticmethod
+    def _sweep_step(seconds_remaining: int, total: float) -> tuple[float, object]:
+        """Antenna position and head pose for a point in the countdown sweep."""
+        # Progress through entire countdown (0.0 at start → 1.0 at end)
+        progress = 1 - (seconds_remaining / total)
+        # Antennas sweep from -0.8 to 0.8 radians (full range);
+        # head tilts up gradually, -30 to -50 degrees, in 1° steps so poses are shared
+        return -0.8 + (progress * 1.6), _head_pose(pitch=round(-30 - (progress * 20)))
+
+    def _minute_step(self, seconds_remaining: int) -> tuple[float, object]:
+        """Table lookup of _sweep_step() for the current countdown."""
+        if 0 <= seconds_remaining < len(self._final_minute_table):
+            return self._final_minute_table[seconds_remaining]
+        return self._sweep_step(seconds_remaining, self._total_countdown)
+
     def _get_next_midnight(self) -> datetime:
-        now = datetime.now()
-        tomorrow = now + timedelta(days=1)
-        return tomorrow.replace(hour=0, minute=0, second=0, microsecond=0)
+        return _midnight_after(datetime.now().date())
 
     def _reset_pose(self, reachy: ReachyMini):
         # Keep head up (not too low)
-        head = create_head_pose(yaw=0, pitch=-30, roll=0, degrees=True)
-        reachy.goto_target(head=head, antennas=[0, 0], duration=0.8)
+        reachy.goto_target(head=self._poses['rest'], antennas=[0, 0], duration=0.8)
         time.sleep(0.3)  # Ensure movement completes
 
     def _waiting_idle(self, reachy: ReachyMini):
         """Gentle idle animation."""
         # Keep head up during idle
-        head = create_head_pose(pitch=-30, degrees=True)
-        reachy.goto_target(head=head, antennas=[-0.2, 0.2], duration=0.5)
+        reachy.goto_target(head=self._poses['rest'], antennas=[-0.2, 0.2], duration=0.5)
         reachy.goto_target(antennas=[0.2, -0.2], duration=0.5)
 
     def _final_minute(self, reachy: ReachyMini, seconds_remaining: int):
         """Antennas sweep based on total countdown progress."""
-        total = getattr(self, '_total_countdown', 60)
-        # Progress through entire countdown (0.0 at start → 1.0 at end)
-        progress = 1 - (seconds_remaining / total)
-        
-        # Antennas sweep from -0.8 to 0.8 radians (full range)
-        antenna_pos = -0.8 + (progress * 1.6)
-        reachy.goto_target(antennas=[antenna_pos, antenna_pos], duration=0.4)
-        
-        # Head tilts up gradually
-        pitch = -30 - (progress * 20)  # -30 to -50 degrees
-        head = create_head_pose(pitch=pitch, degrees=True)
-        reachy.goto_target(head=head, duration=0.4)
+        antenna_pos, head = self._minute_step(seconds_remaining)
+        reachy.goto_target(head=head, antennas=[antenna_pos, antenna_pos], duration=0.4)
         
         # Quick antenna flip every 10 seconds to add excitement
         if seconds_remaining % 10 == 0 and seconds_remaining > 0:
             reachy.goto_target(antennas=[0.8, -0.8], duration=0.25)
             reachy.goto_target(antennas=[-0.8, 0.8], duration=0.25)
             reachy.goto_target(antennas=[antenna_pos, antenna_pos], duration=0.25)
-            # Speak interval (enabled by default now)
-            control_state = getattr(self, '_control_state', None)
-            if control_state and control_state.get('speak_intervals', True):
-                self._speak_countdown(seconds_remaining, reachy)
+            # Speak interval (enabled by default now), off the countdown thread:
+            # local TTS blocks for the whole utterance
+            control_state = self._control_state
+            if control_state is not None and control_state.speak_intervals:
+                self._announcements.put((seconds_remaining, reachy, time.monotonic()))
         
         print(f"⏱️ {seconds_remaining}s...")
 
@@ -239,81 +468,134 @@ class ReachyMiniCountdown(ReachyMiniApp):
             
             # Tick-tock: alternate antenna position each second
             # Also continue the sweep progress
-            total = getattr(self, '_total_countdown', 60)
-            progress = 1 - (seconds_remaining / total)
-            base_pos = -0.8 + (progress * 1.6)
+            base_pos, _ = self._minute_step(seconds_remaining)
             
             if seconds_remaining % 2 == 0:
                 reachy.set_target(antennas=[base_pos + 0.3, base_pos - 0.3])  # Tick
             else:
                 reachy.set_target(antennas=[base_pos - 0.3, base_pos + 0.3])  # Tock
             
-            # Always speak in final 10 (in background thread for speed)
-            threading.Thread(
-                target=self._speak_countdown,
-                args=(seconds_remaining, reachy),
-                daemon=True
-            ).start()
+            # Always speak in final 10 (on the announcer thread so the tick is not delayed)
+            self._announcements.put((seconds_remaining, reachy, time.monotonic()))
         else:
             print("🎉 ZERO! 🎉")
 
+    def _announcer(self):
+        """Speak queued countdown numbers, one at a time, for the life of the app.
+
+        If speaking a number overruns its second, the numbers queued behind
+        it are already behind the countdown: only the newest is kept, and
+        it too is dropped once it is more than ANNOUNCEMENT_MAX_DELAY old.
+        """
+        while True:
+            item = self._announcements.get()
+            try:
+                while True:
+                    item = self._announcements.get_nowait()
+            except queue.Empty:
+                pass
+            number, reachy, queued = item
+            if time.monotonic() - queued > self.ANNOUNCEMENT_MAX_DELAY:
+                continue
+            try:
+                self._speak_countdown(number, reachy)
+            except Exception as e:
+                print(f"⚠️  Announcement failed: {e}")
+
     def _pre_generate_countdown_audio(self):
         """Pre-generate audio files for countdown numbers 1-60 at startup."""
-        import tempfile
-        temp_dir = tempfile.gettempdir()
+        cache_dir = self._countdown_audio_cache_dir()
+        cache_dir.mkdir(parents=True, exist_ok=True)
         
         print("🔊 Pre-generating countdown audio files...")
         # Generate for 1-10 (final countdown) plus 10, 20, 30, 40, 50, 60 (intervals)
         numbers_to_generate = list(range(1, 11)) + [20, 30, 40, 50, 60]
         
-        for number in numbers_to_generate:
-            try:
-                if sys.platform == 'darwin':
-                    aiff_file = os.path.join(temp_dir, f'countdown_{number}.aiff')
-                    wav_file = os.path.join(temp_dir, f'countdown_{number}.wav')
-                    
-                    # Generate AIFF with say (default format)
-                    subprocess.run(
-                        ['say', '-o', aiff_file, str(number)],
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL,
-                        timeout=5
-                    )
-                    
-                    if os.path.exists(aiff_file):
-                        # Convert to WAV (16kHz for robot)
-                        subprocess.run(
-                            ['afconvert', '-f', 'WAVE', '-d', 'LEI16@16000', aiff_file, wav_file],
-                            stdout=subprocess.DEVNULL,
-                            stderr=subprocess.DEVNULL,
-                            timeout=5
-                        )
-                        if os.path.exists(wav_file):
-                            self._countdown_audio_files[number] = wav_file
-                            
-                elif sys.platform.startswith('linux'):
-                    wav_file = os.path.join(temp_dir, f'countdown_{number}.wav')
+        # Each number is an independent TTS subprocess, so run them side by side
+        workers = min(len(numbers_to_generate), os.cpu_count() or 4)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(self._generate_one, number, cache_dir) for number in numbers_to_generate]
+            for future in as_completed(futures):
+                number, wav_file = future.result()
+                if wav_file is not None:
+                    self._countdown_audio_files[number] = wav_file
+        
+        print(f"✅ Generated {len(self._countdown_audio_files)} countdown audio files")
+
+    @staticmethod
+    def _countdown_audio_cache_dir() -> Path:
+        """Cache directory for countdown WAVs, keyed by platform and TTS tool.
+
+        The key includes each tool's path and modification time, so a TTS
+        upgrade lands in a fresh directory instead of reusing stale audio.
+        """
+        import tempfile
+        tools = ('say', 'afconvert') if sys.platform == 'darwin' else ('espeak',)
+        key = [sys.platform]
+        for tool in tools:
+            path = shutil.which(tool)
+            key.append(f"{path}:{os.stat(path).st_mtime_ns if path else 0}")
+        digest = hashlib.sha256('|'.join(key).encode()).hexdigest()[:16]
+        return Path(tempfile.gettempdir()) / 'reachy_countdown_cache' / digest
+
+    @staticmethod
+    def _generate_one(number: int, cache_dir: Path) -> tuple[int, str | None]:
+        """Synthesize one countdown number to a WAV file; returns (number, path or None).
+
+        Files already in the cache are reused. New ones are written under a
+        temporary name and moved into place, so an interrupted run never
+        leaves a partial file behind for the next one to pick up.
+        """
+        wav_file = cache_dir / f'countdown_{number}.wav'
+        if wav_file.exists() and wav_file.stat().st_size > 0:
+            return number, str(wav_file)
+        tmp_file = cache_dir / f'countdown_{number}.{os.getpid()}.tmp.wav'
+        try:
+            if sys.platform == 'darwin':
+                aiff_file = cache_dir / f'countdown_{number}.{os.getpid()}.tmp.aiff'
+                
+                # Generate AIFF with say (default format)
+                subprocess.run(
+                    ['say', '-o', aiff_file, str(number)],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    timeout=5
+                )
+                
+                if os.path.exists(aiff_file):
+                    # Convert to WAV (16kHz for robot)
                     subprocess.run(
-                        ['espeak', '-w', wav_file, str(number)],
+                        ['afconvert', '-f', 'WAVE', '-d', 'LEI16@16000', aiff_file, tmp_file],
                         stdout=subprocess.DEVNULL,
                         stderr=subprocess.DEVNULL,
                         timeout=5
                     )
-                    if os.path.exists(wav_file):
-                        self._countdown_audio_files[number] = wav_file
+                    os.remove(aiff_file)
                         
-            except Exception as e:
-                print(f"⚠️  Failed to generate audio for {number}: {e}")
-        
-        print(f"✅ Generated {len(self._countdown_audio_files)} countdown audio files")
+            elif sys.platform.startswith('linux'):
+                subprocess.run(
+                    ['espeak', '-w', tmp_file, str(number)],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    timeout=5
+                )
+            
+            if tmp_file.exists() and tmp_file.stat().st_size > 0:
+                os.replace(tmp_file, wav_file)
+                return number, str(wav_file)
+                    
+        except Exception as e:
+            print(f"⚠️  Failed to generate audio for {number}: {e}")
+        tmp_file.unlink(missing_ok=True)
+        return number, None
     
     def _speak_countdown(self, number: int, reachy: ReachyMini | None = None):
         """Speak the countdown number - uses pre-generated audio for speed."""
         # Use pre-generated audio file if available
-        if number in self._countdown_audio_files and reachy is not None:
+        play = self._countdown_calls.get(number) if reachy is not None else None
+        if play is not None:
             try:
-                audio_file = self._countdown_audio_files[number]
-                reachy.media.audio.play_sound(audio_file)
+                play()
                 print(f"🔊 {number}")
                 return
             except Exception as e:
@@ -324,41 +606,77 @@ class ReachyMiniCountdown(ReachyMiniApp):
     
     def _speak_countdown_local(self, number: int):
         """Fallback: speak using local system TTS."""
+        # Replaying the pre-generated file is much cheaper than re-synthesizing
+        audio_file = self._countdown_audio_files.get(number)
+        if audio_file is not None and self._play_local_file(audio_file):
+            return
         try:
-            if sys.platform == 'darwin':
-                subprocess.Popen(['say', str(number)], 
-                               stdout=subprocess.DEVNULL, 
-                               stderr=subprocess.DEVNULL)
-            elif sys.platform.startswith('linux'):
-                for tts in ['espeak', 'festival']:
-                    try:
-                        if tts == 'espeak':
-                            subprocess.Popen(['espeak', str(number)],
-                                           stdout=subprocess.DEVNULL,
-                                           stderr=subprocess.DEVNULL)
-                        else:
-                            subprocess.Popen(['festival', '--tts'], 
-                                           input=f"{number}\n".encode(),
-                                           stdout=subprocess.DEVNULL,
-                                           stderr=subprocess.DEVNULL)
-                        break
-                    except FileNotFoundError:
-                        continue
-            else:
-                try:
-                    import win32com.client
-                    speaker = win32com.client.Dispatch("SAPI.SpVoice")
-                    speaker.Speak(str(number))
-                except ImportError:
-                    subprocess.Popen(['powershell', '-Command', 
-                                    f'Add-Type -AssemblyName System.Speech; '
-                                    f'$speak = New-Object System.Speech.Synthesis.SpeechSynthesizer; '
-                                    f'$speak.Speak("{number}")'],
-                                   stdout=subprocess.DEVNULL,
-                                   stderr=subprocess.DEVNULL)
+            self._speak_local(number)
         except Exception:
             pass
 
+    def _speak_macos(self, number: int):
+        subprocess.Popen(['say', str(number)], 
+                       stdout=subprocess.DEVNULL, 
+                       stderr=subprocess.DEVNULL)
+
+    @staticmethod
+    def _init_tts():
+        """Long-lived pyttsx3 engine, or None if pyttsx3 or its driver is unavailable."""
+        try:
+            import pyttsx3
+            return pyttsx3.init()
+        except ImportError:
+            return None
+        except Exception as e:
+            logger.debug("pyttsx3 unavailable: %s", e)
+            return None
+
+    def _speak_countdown_tts(self, number: int):
+        # The engine is not thread-safe and announcements come from worker threads
+        try:
+            with self._tts_lock:
+                self._tts.say(str(number))
+                self._tts.runAndWait()
+        except Exception:
+            self._speak_linux(number)
+
+    def _speak_linux(self, number: int):
+        if _LINUX_TTS == 'espeak':
+            subprocess.Popen(['espeak', str(number)],
+                           stdout=subprocess.DEVNULL,
+                           stderr=subprocess.DEVNULL)
+        elif _LINUX_TTS == 'festival':
+            proc = subprocess.Popen(['festival', '--tts'],
+                                  stdin=subprocess.PIPE,
+                                  stdout=subprocess.DEVNULL,
+                                  stderr=subprocess.DEVNULL)
+            proc.stdin.write(f"{number}\n".encode())
+            proc.stdin.close()
+
+    def _speak_windows(self, number: int):
+        try:
+            import win32com.client
+            speaker = win32com.client.Dispatch("SAPI.SpVoice")
+            speaker.Speak(str(number))
+        except ImportError:
+            subprocess.Popen(['powershell', '-Command', 
+                            f'Add-Type -AssemblyName System.Speech; '
+                            f'$speak = New-Object System.Speech.Synthesis.SpeechSynthesizer; '
+                            f'$speak.Speak("{number}")'],
+                           stdout=subprocess.DEVNULL,
+                           stderr=subprocess.DEVNULL)
+
+    def _play_local_file(self, audio_file: str) -> bool:
+        """Play a pre-generated WAV on the computer speaker; False if no player."""
+        if _WAV_PLAYER is None:
+            return False
+        try:
+            subprocess.Popen([*_WAV_PLAYER, audio_file], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            return True
+        except (FileNotFoundError, OSError):
+            return False
+
     def _stop_audio_playback(self, reachy: ReachyMini, audio_stop_event: threading.Event | None = None) -> None:
         """Stop any ongoing audio playback both on the robot and local fallbacks."""
         if audio_stop_event is not None:
@@ -380,15 +698,80 @@ class ReachyMiniCountdown(ReachyMiniApp):
                 still_running.append(proc)
         self._audio_procs = still_running
 
-    def _play_youtube_audio(self, url: str, stop_event: threading.Event, audio_stop: threading.Event, reachy: ReachyMini):
-        """Play audio from a YouTube video in the background on the robot speaker when possible."""
+    def _bind_audio(self, reachy: ReachyMini) -> None:
+        """Bind the robot's play_sound to each pre-generated countdown file."""
+        audio = getattr(reachy.media, "audio", None)
+        if audio is None:
+            return
+        self._countdown_calls = {
+            number: functools.partial(audio.play_sound, audio_file)
+            for number, audio_file in self._countdown_audio_files.items()
+        }
+
+    def _prime_audio(self, reachy: ReachyMini) -> None:
+        """Warm up the robot audio pipeline once so the first real announcement is not late.
+
+        Plays a short silent clip, so the backend's cold-start cost is paid
+        here instead of on "10" without anything being heard.
+        """
+        if self._primed:
+            return
+        self._primed = True
+        audio = getattr(reachy.media, "audio", None)
+        if audio is None:
+            return
         try:
+            audio.play_sound(self._silent_wav(self._countdown_audio_cache_dir()))
+        except Exception as e:
+            logger.debug("Audio priming failed: %s", e)
+
+    @staticmethod
+    def _silent_wav(cache_dir: Path) -> str:
+        """Path of a 50 ms silent WAV in the countdown audio cache, written on first use."""
+        wav_file = cache_dir / 'silence.wav'
+        if not wav_file.exists():
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_dir / f'silence.{os.getpid()}.tmp.wav'
+            with wave.open(str(tmp_file), 'wb') as out:
+                # 16 kHz mono 16-bit PCM, the robot speaker format
+                out.setnchannels(1)
+                out.setsampwidth(2)
+                out.setframerate(16000)
+                out.writeframes(bytes(2 * 800))
+            os.replace(tmp_file, wav_file)
+        return str(wav_file)
+
+    def _celebration_audio_url(self) -> str:
+        """YouTube URL for the celebration music (web UI setting or default)."""
+        control_state = self._control_state
+        return (control_state.youtube_url if control_state else None) or self.AULD_LANG_SYNE_URL
+
+    def _prefetch_audio(self, url: str) -> None:
+        """Download the celebration music ahead of time so it starts instantly at zero."""
+        try:
+            self._get_youtube_audio_file(url)
+        except Exception as e:
+            print(f"⚠️  Could not prefetch celebration audio: {e}")
+
+    @staticmethod
+    def _youtube_cache_path(url: str) -> Path:
+        """Where the MP3 for a YouTube URL is kept across runs."""
+        import tempfile
+        digest = hashlib.sha256(url.encode()).hexdigest()[:16]
+        return Path(tempfile.gettempdir()) / f'reachy_yt_{digest}.mp3'
+
+    def _get_youtube_audio_file(self, url: str) -> str | None:
+        """Return a local MP3 of the YouTube audio, downloading it on first use."""
+        with self._youtube_audio_lock:
+            cache_file = self._youtube_cache_path(url)
+            if cache_file.exists():
+                cache_file.touch()  # Most recently used, for the sweep below
+                return str(cache_file)
+
             import yt_dlp
-            import tempfile
             
-            # Download audio to temporary file
-            temp_dir = tempfile.gettempdir()
-            output_template = os.path.join(temp_dir, 'auld_lang_syne_%(id)s.%(ext)s')
+            # Download next to the cache file, then move it into place
+            output_template = str(cache_file.with_suffix('')) + f'.{os.getpid()}.%(ext)s'
             
             ydl_opts = {
                 'format': 'bestaudio/best',
@@ -405,52 +788,104 @@ class ReachyMiniCountdown(ReachyMiniApp):
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
                 info = ydl.extract_info(url, download=True)
                 filename = ydl.prepare_filename(info)
-                # Change extension to .mp3 after extraction
-                audio_file = os.path.splitext(filename)[0] + '.mp3'
-                
-                if os.path.exists(audio_file):
-                    # Try to play on the robot speaker first
-                    try:
-                        if hasattr(reachy.media, "audio") and hasattr(reachy.media.audio, "play_sound"):
-                            reachy.media.audio.play_sound(audio_file)
-                            print("🎵 Playing YouTube audio on Reachy Mini speaker...")
-                        else:
-                            raise AttributeError("media.audio.play_sound not available")
-                    except Exception as play_err:
-                        print(f"⚠️  Could not play on robot speaker ({play_err}), playing locally")
-                        # Fallback: play locally using system player
-                        proc: subprocess.Popen | None = None
-                        if sys.platform == 'darwin':
-                            proc = subprocess.Popen(['afplay', audio_file],
-                                                   stdout=subprocess.DEVNULL,
-                                                   stderr=subprocess.DEVNULL)
-                        elif sys.platform.startswith('linux'):
-                            for player in ['paplay', 'aplay', 'mpg123', 'ffplay']:
-                                try:
-                                    proc = subprocess.Popen([player, audio_file],
-                                                           stdout=subprocess.DEVNULL,
-                                                           stderr=subprocess.DEVNULL)
-                                    break
-                                except FileNotFoundError:
-                                    continue
-                        else:
-                            proc = subprocess.Popen(['start', audio_file], shell=True,
-                                                   stdout=subprocess.DEVNULL,
-                                                   stderr=subprocess.DEVNULL)
-                        print("🎵 Playing YouTube audio locally...")
-                        if proc is not None:
-                            self._audio_procs.append(proc)
-                            # Wait and allow stop
-                            while proc.poll() is None:
-                                if stop_event.is_set() or audio_stop.is_set():
-                                    try:
-                                        proc.terminate()
-                                    except Exception:
-                                        pass
-                                    break
-                                time.sleep(0.25)
+            # Change extension to .mp3 after extraction
+            audio_file = os.path.splitext(filename)[0] + '.mp3'
+            if not os.path.exists(audio_file):
+                return None
+            os.replace(audio_file, cache_file)
+            self._sweep_youtube_cache(cache_file.parent)
+            return str(cache_file)
+
+    @staticmethod
+    def _sweep_youtube_cache(cache_dir: Path, keep: int = 5) -> None:
+        """Delete all but the `keep` most recently used cached tracks."""
+        tracks = sorted(cache_dir.glob('reachy_yt_*.mp3'), key=lambda p: p.stat().st_mtime, reverse=True)
+        for old in tracks[keep:]:
+            try:
+                old.unlink()
+            except OSError:
+                pass
+
+    def _downloaded_youtube_audio(self, url: str) -> str | None:
+        """The MP3 for url if it is already on disk, without waiting on a download."""
+        cache_file = self._youtube_cache_path(url)
+        return str(cache_file) if cache_file.exists() else None
+
+    def _stream_youtube_audio(self, url: str) -> subprocess.Popen | None:
+        """Play the YouTube audio straight from its stream URL with ffplay."""
+        import yt_dlp
+
+        with yt_dlp.YoutubeDL({'format': 'bestaudio/best', 'quiet': True, 'no_warnings': True}) as ydl:
+            info = ydl.extract_info(url, download=False)
+        stream_url = info.get('url')
+        if not stream_url:
+            return None
+        return subprocess.Popen([_FFPLAY, '-nodisp', '-autoexit', '-loglevel', 'quiet', stream_url],
+                                stdout=subprocess.DEVNULL,
+                                stderr=subprocess.DEVNULL)
+
+    def _wait_local_player(self, proc: subprocess.Popen, stop_event: threading.Event,
+                           audio_stop: threading.Event) -> None:
+        """Wait for a local player to finish, terminating it on stop."""
+        while not (stop_event.is_set() or audio_stop.is_set()):
+            try:
+                # Returns as soon as the player exits; the timeout only bounds stop latency
+                proc.wait(timeout=0.5)
+                return
+            except subprocess.TimeoutExpired:
+                pass
+        try:
+            proc.terminate()
+        except Exception:
+            pass
+
+    def _play_youtube_audio(self, url: str, stop_event: threading.Event, audio_stop: threading.Event, reachy: ReachyMini):
+        """Play audio from a YouTube video in the background on the robot speaker when possible."""
+        try:
+            # Usually already downloaded by _prefetch_audio when the countdown started;
+            # if not, stream it locally now instead of waiting for the download
+            if self._downloaded_youtube_audio(url) is None and _FFPLAY is not None:
+                proc = self._stream_youtube_audio(url)
+                if proc is not None:
+                    print("🎵 Streaming YouTube audio locally...")
+                    self._audio_procs.append(proc)
+                    self._wait_local_player(proc, stop_event, audio_stop)
+                    return
+            audio_file = self._get_youtube_audio_file(url)
+            if audio_file is None:
+                print("⚠️  Audio file not found after download")
+                return
+
+            # Try to play on the robot speaker first
+            try:
+                if hasattr(reachy.media, "audio") and hasattr(reachy.media.audio, "play_sound"):
+                    reachy.media.audio.play_sound(audio_file)
+                    print("🎵 Playing YouTube audio on Reachy Mini speaker...")
+                else:
+                    raise AttributeError("media.audio.play_sound not available")
+            except Exception as play_err:
+                print(f"⚠️  Could not play on robot speaker ({play_err}), playing locally")
+                # Fallback: play locally using system player
+                proc: subprocess.Popen | None = None
+                if sys.platform == 'darwin':
+                    proc = subprocess.Popen(['afplay', audio_file],
+                                           stdout=subprocess.DEVNULL,
+                                           stderr=subprocess.DEVNULL)
+                elif sys.platform.startswith('linux'):
+                    if _MUSIC_PLAYER is None:
+                        print("⚠️  No local audio player found (paplay, aplay, mpg123, ffplay)")
+                        return
+                    proc = subprocess.Popen([_MUSIC_PLAYER, audio_file],
+                                           stdout=subprocess.DEVNULL,
+                                           stderr=subprocess.DEVNULL)
                 else:
-                    print("⚠️  Audio file not found after download")
+                    proc = subprocess.Popen(['start', audio_file], shell=True,
+                                           stdout=subprocess.DEVNULL,
+                                           stderr=subprocess.DEVNULL)
+                print("🎵 Playing YouTube audio locally...")
+                if proc is not None:
+                    self._audio_procs.append(proc)
+                    self._wait_local_player(proc, stop_event, audio_stop)
         except ImportError:
             print("⚠️  yt-dlp not installed. Install with: uv sync or pip install yt-dlp")
         except Exception as e:
@@ -464,16 +899,17 @@ class ReachyMiniCountdown(ReachyMiniApp):
     def _celebrate(self, reachy: ReachyMini, stop_event: threading.Event):
         """🎉 CELEBRATION!"""
         # Check for easter egg
-        control_state = getattr(self, '_control_state', None)
-        easter_egg = control_state.get('easter_egg', False) if control_state else False
+        control_state = self._control_state
+        easter_egg = False
+        if control_state is not None:
+            # Consume the easter egg so it only applies to this celebration
+            with control_state.lock:
+                easter_egg, control_state.easter_egg = control_state.easter_egg, False
         
         if easter_egg:
             print("\n🥚🥚🥚 EASTER EGG ACTIVATED! 🥚🥚🥚\n")
             print("🎊 Special celebration mode! 🎊\n")
             self._easter_egg_celebration(reachy, stop_event)
-            # Reset easter egg
-            if control_state:
-                control_state['easter_egg'] = False
             return
         
         print("\n🎉🎉🎉 HAPPY NEW YEAR! 🎉🎉🎉\n")
@@ -481,9 +917,7 @@ class ReachyMiniCountdown(ReachyMiniApp):
         # Start playing Auld Lang Syne from YouTube in background
         audio_stop = threading.Event()
         self._audio_stop_event = audio_stop
-        audio_url = control_state.get('youtube_url') if control_state else None
-        if not audio_url:
-            audio_url = self.AULD_LANG_SYNE_URL
+        audio_url = self._celebration_audio_url()
         audio_thread = threading.Thread(
             target=self._play_youtube_audio,
             args=(audio_url, stop_event, audio_stop, reachy),
@@ -491,70 +925,56 @@ class ReachyMiniCountdown(ReachyMiniApp):
         )
         audio_thread.start()
 
-        # Initial burst - 3 big spins (slower and smoother, with error handling)
-        for _ in range(3):
-            if stop_event.is_set():
-                return
-            try:
-                reachy.goto_target(antennas=[0.6, -0.4], duration=0.4)
-                head = create_head_pose(roll=15, pitch=-35, yaw=-20, degrees=True)
-                reachy.goto_target(head=head, duration=0.4)
-                
-                reachy.goto_target(antennas=[-0.4, 0.6], duration=0.4)
-                head = create_head_pose(roll=-15, pitch=-35, yaw=20, degrees=True)
-                reachy.goto_target(head=head, duration=0.4)
-            except (TimeoutError, Exception) as e:
-                print(f"Spin timeout (continuing): {type(e).__name__}")
-                time.sleep(0.2)
+        try:
+            # Initial burst - 3 big spins (slower and smoother, with error handling)
+            for _ in range(3):
+                if stop_event.is_set():
+                    return
+                try:
+                    reachy.goto_target(head=self._poses['spin_left'], antennas=[0.6, -0.4], duration=0.4)
+                    reachy.goto_target(head=self._poses['spin_right'], antennas=[-0.4, 0.6], duration=0.4)
+                except TimeoutError:
+                    logger.debug("Spin timeout (continuing)")
+                    time.sleep(0.2)
 
-        # Victory pose
-        reachy.goto_target(antennas=[0.6, 0.6], duration=0.2)
-        head = create_head_pose(pitch=-45, degrees=True)
-        reachy.goto_target(head=head, duration=0.3)
-        time.sleep(0.5)
+            # Victory pose
+            reachy.goto_target(head=self._poses['victory'], antennas=[0.6, 0.6], duration=0.3)
+            time.sleep(0.5)
 
-        # Celebration loop
-        start = time.time()
-        beat = 0
+            # Celebration loop
+            start = time.monotonic()
+            beat = 0
         
-        while time.time() - start < self.CELEBRATION_DURATION:
-            if stop_event.is_set():
-                return
-            
-            beat += 1
-            time.sleep(0.1)  # Small delay to prevent overwhelming the daemon
+            while time.monotonic() - start < self.CELEBRATION_DURATION:
+                if stop_event.is_set():
+                    return
             
-            # Alternating dance (smoother, with error handling)
-            try:
-                if beat % 2 == 0:
-                    reachy.goto_target(antennas=[0.5, -0.2], duration=0.4)
-                    head = create_head_pose(roll=10, pitch=-30, yaw=-15, degrees=True)
-                else:
-                    reachy.goto_target(antennas=[-0.2, 0.5], duration=0.4)
-                    head = create_head_pose(roll=-10, pitch=-30, yaw=15, degrees=True)
-                
-                reachy.goto_target(head=head, duration=0.4)
-            except (TimeoutError, Exception) as e:
-                # If movement times out, just continue
-                print(f"Movement timeout (continuing): {type(e).__name__}")
+                beat += 1
+                time.sleep(0.1)  # Small delay to prevent overwhelming the daemon
             
-            # Big move every 5 beats
-            if beat % 5 == 0:
+                # Alternating dance (smoother, with error handling)
                 try:
-                    reachy.goto_target(antennas=[0.6, 0.6], duration=0.5)
-                    head = create_head_pose(pitch=-40, degrees=True)
-                    reachy.goto_target(head=head, duration=0.5)
-                    time.sleep(0.3)
-                except (TimeoutError, Exception) as e:
-                    print(f"Big move timeout (continuing): {type(e).__name__}")
-                    time.sleep(0.2)
+                    if beat % 2 == 0:
+                        reachy.goto_target(head=self._poses['dance_left'], antennas=[0.5, -0.2], duration=0.4)
+                    else:
+                        reachy.goto_target(head=self._poses['dance_right'], antennas=[-0.2, 0.5], duration=0.4)
+                except TimeoutError:
+                    # If movement times out, just continue
+                    logger.debug("Movement timeout (continuing)")
+            
+                # Big move every 5 beats
+                if beat % 5 == 0:
+                    try:
+                        reachy.goto_target(head=self._poses['big_move'], antennas=[0.6, 0.6], duration=0.5)
+                        time.sleep(0.3)
+                    except TimeoutError:
+                        logger.debug("Big move timeout (continuing)")
+                        time.sleep(0.2)
 
-        print("🎊 Celebration complete!")
-        # Stop any lingering audio (robot or local fallback)
-        self._stop_audio_playback(reachy, audio_stop)
-        # Stop any lingering audio (robot or local fallback)
-        audio_stop.set()
-        self._stop_audio_playback(reachy)
+            print("🎊 Celebration complete!")
+        finally:
+            # Stop the song however the dance ends (robot or local fallback)
+            self._stop_audio_playback(reachy, audio_stop)
     
     def _easter_egg_celebration(self, reachy: ReachyMini, stop_event: threading.Event):
         """🥚 Special easter egg celebration - extra special dance!"""
@@ -566,13 +986,8 @@ class ReachyMiniCountdown(ReachyMiniApp):
                 return
             try:
                 # Fast alternating spins
-                reachy.goto_target(antennas=[0.8, -0.6], duration=0.3)
-                head = create_head_pose(roll=20, pitch=-40, yaw=-30, degrees=True)
-                reachy.goto_target(head=head, duration=0.3)
-                
-                reachy.goto_target(antennas=[-0.6, 0.8], duration=0.3)
-                head = create_head_pose(roll=-20, pitch=-40, yaw=30, degrees=True)
-                reachy.goto_target(head=head, duration=0.3)
+                reachy.goto_target(head=self._poses['egg_spin_left'], antennas=[0.8, -0.6], duration=0.3)
+                reachy.goto_target(head=self._poses['egg_spin_right'], antennas=[-0.6, 0.8], duration=0.3)
             except Exception as e:
                 print(f"Easter egg move error: {type(e).__name__}")
                 time.sleep(0.1)
@@ -582,14 +997,10 @@ class ReachyMiniCountdown(ReachyMiniApp):
             if stop_event.is_set():
                 return
             try:
-                reachy.goto_target(antennas=[0.7, 0.7], duration=0.2)
-                head = create_head_pose(pitch=-50, roll=10, yaw=0, degrees=True)
-                reachy.goto_target(head=head, duration=0.2)
+                reachy.goto_target(head=self._poses['egg_victory_left'], antennas=[0.7, 0.7], duration=0.2)
                 time.sleep(0.2)
                 
-                reachy.goto_target(antennas=[0.7, 0.7], duration=0.2)
-                head = create_head_pose(pitch=-50, roll=-10, yaw=0, degrees=True)
-                reachy.goto_target(head=head, duration=0.2)
+                reachy.goto_target(head=self._poses['egg_victory_right'], antennas=[0.7, 0.7], duration=0.2)
                 time.sleep(0.2)
             except Exception as e:
                 print(f"Easter egg pose error: {type(e).__name__}")
@@ -597,6 +1008,279 @@ class ReachyMiniCountdown(ReachyMiniApp):
         print("✨ Easter egg celebration complete! ✨")
 
 
+CAPTURE_FPS = 30.0
+CAMERA_ERROR_BACKOFF_MIN = 0.1
+CAMERA_ERROR_BACKOFF_MAX = 2.0
+# Recorder hand-off: queued frames, and preallocated frame slots (queue + in-flight + spare)
+RECORD_QUEUE_SIZE = 4
+RECORD_RING_SIZE = 8
+# Linux, best effort: the capture thread is pinned to the last CPU at this
+# niceness and the recorder is kept off it. Other threads (countdown loop,
+# announcer, web requests) may still share that CPU
+CAPTURE_NICE = -5
+_CAPTURE_CPU = (
+    max(os.sched_getaffinity(0))
+    if hasattr(os, 'sched_getaffinity') and len(os.sched_getaffinity(0)) > 1
+    else None
+)
+# The first recorded frame is written this many times so players that skip
+# the opening frames still show the start of the countdown; as many of the
+# following frames are dropped, so the file stays on capture time
+RECORD_LEAD_IN_FRAMES = 3
+# Per-part MJPEG header; Content-Length lets the browser skip boundary scanning
+_MJPEG_HEADER = b'--frame\r\nContent-Type: image/jpeg\r\nContent-Length: %d\r\n\r\n'
+_MJPEG_TRAILER = b'\r\n'
+# JPEG quality steps for /video_feed clients, best first; slow clients step down
+JPEG_QUALITY_TIERS = (80, 70, 50)
+# Countdown lengths accepted from the web UI, in seconds
+COUNTDOWN_SECONDS_MIN = 5
+COUNTDOWN_SECONDS_MAX = 3600
+# Every open tab holds two never-ending responses (/video_feed and /events),
+# each pinning a server thread. Streams past MAX_STREAMS get 503, and the
+# waitress pool keeps SHORT_REQUEST_THREADS on top for the page and controls.
+MAX_STREAMS = 32
+SHORT_REQUEST_THREADS = 8
+# Output waitress buffers per connection before a write blocks (default 16 MB).
+# A few frames' worth, so a slow /video_feed reader blocks the generator,
+# which AdaptiveQuality measures, instead of queueing seconds of video.
+STREAM_OUTBUF_HIGH_WATERMARK = 512 * 1024
+
+# /easter-egg answers are constant, so they are serialized once
+_EASTER_EGG_SECRETS = frozenset({'konami', '1337', 'secret', 'easter'})
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+
+def _dumps(obj) -> bytes:
+    """Serialize a JSON response body, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def _json_response(obj, status: int = 200) -> tuple[bytes, int, dict]:
+    """A (body, status, headers) JSON answer, without jsonify's per-call Response setup."""
+    return _dumps(obj), status, _JSON_HEADERS
+
+
+_EASTER_EGG_OK = _json_response({
+    'success': True,
+    'message': '🥚 Easter egg activated! Check the celebration!',
+    'hint': 'The robot will do something special next time it celebrates...'
+})
+_EASTER_EGG_MISS = _json_response({'success': False, 'message': 'Not the right secret...'}, 404)
+
+# Stop/reset descriptions, and the prebuilt POST /control answer for each alone
+_CONTROL_MESSAGES = {Command.STOP: 'Countdown stopped', Command.RESET: 'Countdown reset'}
+_CONTROL_OK = {
+    action: _json_response({'success': True, 'message': message, 'applied': 1})
+    for action, message in _CONTROL_MESSAGES.items()
+}
+
+
+class FrameBroker:
+    """Latest camera frame, shared by every /video_feed client.
+
+    One capture thread encodes each frame once at the top quality and
+    publishes it here; the per-client generators only wait for a new
+    sequence number and yield the shared JPEG bytes, so encode cost does not
+    grow with the viewer count. Clients that fall back to a lower quality
+    tier encode it lazily, at most once per frame and tier. Each JPEG is
+    kept with its multipart header, so clients only yield shared bytes.
+    """
+
+    def __init__(self):
+        self.cond = threading.Condition()
+        self.frame: np.ndarray | None = None
+        self.jpeg: bytes | None = None
+        self.seq = 0
+        self._encoded: dict[int, tuple[bytes, bytes]] = {}
+        self._encode_lock = threading.Lock()
+
+    def publish(self, frame: np.ndarray, jpeg: bytes) -> None:
+        with self.cond:
+            self.frame = frame
+            self.jpeg = jpeg
+            self._encoded = {JPEG_QUALITY_TIERS[0]: (_MJPEG_HEADER % len(jpeg), jpeg)}
+            self.seq += 1
+            self.cond.notify_all()
+
+    def close(self) -> None:
+        """Wake all waiting clients so they can notice shutdown."""
+        with self.cond:
+            self.cond.notify_all()
+
+    def encoded(self, quality: int) -> tuple[bytes, bytes] | None:
+        """The latest frame as (multipart header, JPEG) at the given quality."""
+        with self.cond:
+            frame, encoded = self.frame, self._encoded
+        parts = encoded.get(quality)
+        if parts is None and frame is not None:
+            with self._encode_lock:
+                parts = encoded.get(quality)
+                if parts is None:
+                    jpeg = _encode_jpeg(frame, quality)
+                    if jpeg is not None:
+                        parts = encoded[quality] = (_MJPEG_HEADER % len(jpeg), jpeg)
+        return parts
+
+    def frames(self, stop_event: threading.Event, quality: "AdaptiveQuality"):
+        """Yield (header, JPEG) for each newly published frame until stop_event is set."""
+        last = 0
+        while not stop_event.is_set():
+            with self.cond:
+                self.cond.wait_for(lambda: self.seq != last or stop_event.is_set(), timeout=1.0)
+                if self.seq == last:
+                    continue
+                last = self.seq
+            parts = self.encoded(quality.quality)
+            if parts is not None:
+                yield parts
+
+
+class StreamSlot:
+    """Response body that holds one of the MAX_STREAMS slots until the server closes it.
+
+    WSGI servers call close() on the body however the response ends, even
+    if it was never iterated, so the slot cannot leak.
+    """
+
+    def __init__(self, body, slots: threading.BoundedSemaphore):
+        self._body = body
+        self._slots: threading.BoundedSemaphore | None = slots
+
+    def __iter__(self):
+        return iter(self._body)
+
+    def close(self) -> None:
+        slots, self._slots = self._slots, None
+        if slots is None:
+            return
+        try:
+            close = getattr(self._body, 'close', None)
+            if close is not None:
+                close()
+        finally:
+            slots.release()
+
+
+class AdaptiveQuality:
+    """Per-client JPEG quality that steps down when sends back up.
+
+    Each yield of the MJPEG generator returns only once the server has taken
+    the chunk. The dev server writes straight to the socket; waitress
+    blocks once a connection has STREAM_OUTBUF_HIGH_WATERMARK bytes
+    buffered. Either way, the time spent suspended tracks how fast the
+    client drains the stream, and frames published meanwhile are skipped.
+    When the p95 of a window of sends exceeds SLOW_SEND_S the client drops
+    one quality tier; a fast window steps it back up.
+    """
+
+    SLOW_SEND_S = 0.05
+    FAST_SEND_S = 0.01
+
+    def __init__(self, window: int = 30):
+        self._tier = 0
+        self._samples: collections.deque[float] = collections.deque(maxlen=window)
+
+    @property
+    def quality(self) -> int:
+        return JPEG_QUALITY_TIERS[self._tier]
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+        if len(self._samples) < self._samples.maxlen:
+            return
+        p95 = sorted(self._samples)[int(len(self._samples) * 0.95) - 1]
+        if p95 > self.SLOW_SEND_S and self._tier < len(JPEG_QUALITY_TIERS) - 1:
+            self._tier += 1
+        elif p95 < self.FAST_SEND_S and self._tier > 0:
+            self._tier -= 1
+        else:
+            return
+        self._samples.clear()
+
+
+_JPEG_PARAMS = {quality: [cv2.IMWRITE_JPEG_QUALITY, quality] for quality in JPEG_QUALITY_TIERS}
+
+
+def _encode_jpeg(frame: np.ndarray, quality: int = JPEG_QUALITY_TIERS[0]) -> bytes | None:
+    """JPEG-encode a BGR camera frame; the single encode path for streaming.
+
+    The result is one immutable bytes object (a single copy out of OpenCV's
+    output array) that the broker hands to every viewer as-is.
+    """
+    params = _JPEG_PARAMS.get(quality) or [cv2.IMWRITE_JPEG_QUALITY, quality]
+    ret, buffer = cv2.imencode('.jpg', np.ascontiguousarray(frame), params)
+    return buffer.tobytes() if ret else None
+
+
+def _place_worker_thread(capture: bool) -> None:
+    """Pin the calling thread on Linux: capture onto _CAPTURE_CPU, the recorder off it.
+
+    Best effort - only these two threads are placed, so the CPU is favoured
+    rather than dedicated; raising priority needs CAP_SYS_NICE; and nothing
+    changes on single-core machines or platforms without per-thread affinity.
+    """
+    if _CAPTURE_CPU is None:
+        return
+    try:
+        if capture:
+            os.sched_setaffinity(0, {_CAPTURE_CPU})
+        else:
+            os.sched_setaffinity(0, os.sched_getaffinity(0) - {_CAPTURE_CPU})
+    except OSError:
+        pass
+    if capture:
+        try:
+            # Per-thread on Linux
+            os.nice(CAPTURE_NICE)
+        except OSError:
+            pass
+
+
+def _encode_placeholder() -> bytes | None:
+    """Complete MJPEG part (header, JPEG, trailer) shown on /video_feed when there is no camera."""
+    placeholder = np.zeros((480, 640, 3), dtype=np.uint8)
+    cv2.putText(placeholder, "Camera not available", (120, 240), 
+               cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
+    cv2.putText(placeholder, "(Headless simulation mode)", (140, 280), 
+               cv2.FONT_HERSHEY_SIMPLEX, 0.7, (150, 150, 150), 1)
+    jpeg = _encode_jpeg(placeholder)
+    if jpeg is None:
+        return None
+    return _MJPEG_HEADER % len(jpeg) + jpeg + _MJPEG_TRAILER
+
+
+_PLACEHOLDER_PART = _encode_placeholder()
+
+
+def _open_video_writer(filename: str, fps: float, size: tuple[int, int]):
+    """Open a VideoWriter, preferring H.264 (often hardware-encoded) over software mp4v.
+
+    Set REACHY_FOURCC (e.g. ``hvc1``) to try another four-character codec first.
+    """
+    codecs = ['avc1', 'mp4v']
+    override = os.environ.get('REACHY_FOURCC')
+    if override:
+        if len(override) == 4:
+            codecs.insert(0, override)
+        else:
+            print(f"⚠️  Ignoring REACHY_FOURCC={override!r}: a FourCC is four characters")
+    for codec in dict.fromkeys(codecs):
+        writer = cv2.VideoWriter(filename, cv2.VideoWriter_fourcc(*codec), fps, size)
+        if writer.isOpened():
+            return writer
+        writer.release()
+    return None
+
+
+def _format_url(host: str, port: int) -> str:
+    """URL to open the web UI from this machine."""
+    if host in ("0.0.0.0", "127.0.0.1"):
+        return f"http://127.0.0.1:{port}"
+    return f"http://{host}:{port}"
+
+
 def _parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Reachy Mini countdown app")
 
@@ -651,6 +1335,12 @@ def _parse_args() -> argparse.Namespace:
         default=None,
         help="Output video filename (default: countdown_YYYYMMDD_HHMMSS.mp4)",
     )
+    parser.add_argument(
+        "--robust-record",
+        action="store_true",
+        help="With --record, also write an independent second copy (<name>_copy.mp4); "
+             "doubles the encoding work on the recorder thread",
+    )
     parser.add_argument(
         "--youtube-url",
         type=str,
@@ -680,24 +1370,36 @@ def _parse_args() -> argparse.Namespace:
 def _start_camera_ui(
     reachy_mini: ReachyMini,
     stop_event: threading.Event,
-    countdown_state: dict,
-    control_state: dict,
+    countdown_state: CountdownState,
+    control_state: ControlState,
     port: int = 5001,
     host: str = "0.0.0.0",
     record_video: bool = False,
     video_filename: str | None = None,
+    robust_record: bool = False,
     emoji: str = "🎉",
     camera_available: bool = True,
     youtube_url: str = "",
+    post_command=None,
+    ui_url: str | None = None,
 ) -> None:
-    """Start Flask web server to display camera feed and countdown."""
-    app = Flask(__name__)
+    """Start Flask web server to display camera feed and countdown.
+
+    ``post_command(action, seconds)`` delivers start/stop/reset to the
+    countdown loop (see ``ReachyMiniCountdown.post_command``).
+    """
+    app = Flask(__name__, template_folder=str(Path(__file__).parent / 'templates'))
+    # The page is rendered once at startup; never stat() the template again
+    app.config['TEMPLATES_AUTO_RELOAD'] = False
+    app.jinja_env.auto_reload = False
     
     # Import Flask request for POST handling
-    from flask import request, jsonify
+    from flask import request
     
     # Video recording setup
     video_writer = None
+    video_writer_copy = None
+    video_copy_filename = None
     if record_video:
         if reachy_mini.media.camera is None:
             print("⚠️  Video recording disabled: no camera available")
@@ -712,467 +1414,135 @@ def _start_camera_ui(
                 test_frame = reachy_mini.media.get_frame()
                 if test_frame is not None:
                     height, width = test_frame.shape[:2]
-                    fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-                    video_writer = cv2.VideoWriter(video_filename, fourcc, 30.0, (width, height))
-                    print(f"📹 Recording video to: {video_filename}")
+                    video_writer = _open_video_writer(video_filename, CAPTURE_FPS, (width, height))
+                    if video_writer is not None:
+                        print(f"📹 Recording video to: {video_filename}")
+                        if robust_record:
+                            # Independent second file, in case one ends up truncated
+                            stem, ext = os.path.splitext(video_filename)
+                            video_copy_filename = f"{stem}_copy{ext}"
+                            video_writer_copy = _open_video_writer(video_copy_filename, CAPTURE_FPS, (width, height))
+                            if video_writer_copy is not None:
+                                print(f"📹 Recording a second copy to: {video_copy_filename}")
+                            else:
+                                print(f"⚠️  Could not open a video encoder for {video_copy_filename}; recording one copy only")
+                    else:
+                        print("⚠️  Could not open a video encoder")
+                        record_video = False
             except Exception as e:
                 print(f"⚠️  Could not initialize video recording: {e}")
                 record_video = False
     
-    HTML_TEMPLATE = """
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>Reachy Mini Countdown</title>
-        <meta charset="utf-8">
-        <style>
-            * { margin: 0; padding: 0; box-sizing: border-box; }
-            body {
-                background: #f5f7fb;
-                color: #1f2a3d;
-                font-family: 'Inter', 'Arial', sans-serif;
-                min-height: 100vh;
-                display: flex;
-                flex-direction: column;
-                align-items: center;
-                padding: 24px;
-            }
-            .header {
-                text-align: center;
-                margin-bottom: 24px;
-            }
-            .logo-container {
-                display: inline-block;
-                padding: 12px 20px;
-                background: #ffffff;
-                border-radius: 14px;
-                border: 1px solid #e5e8ef;
-                box-shadow: 0 8px 18px rgba(31,42,61,0.08);
-            }
-            h1 {
-                font-size: 2.2em;
-                font-weight: 800;
-                color: #1f2a3d;
-                letter-spacing: 0.5px;
-            }
-            h1::before, h1::after {
-                content: '__EMOJI__';
-                margin: 0 10px;
-                font-size: 0.9em;
-                vertical-align: middle;
-            }
-            .countdown-display {
-                font-size: 6em;
-                font-weight: 700;
-                color: #1f2a3d;
-                margin: 12px 0 4px;
-                min-height: 64px;
-            }
-            .status {
-                font-size: 1em;
-                color: #4d7cff;
-                margin-bottom: 16px;
-                font-weight: 600;
-            }
-            .camera-container {
-                max-width: 900px;
-                width: 100%;
-                margin: 0 auto;
-                position: relative;
-            }
-            #camera {
-                width: 100%;
-                max-width: 900px;
-                border: 1px solid #e5e8ef;
-                border-radius: 14px;
-                box-shadow: 0 10px 22px rgba(31,42,61,0.08);
-                display: block;
-                background: #000;
-                min-height: 420px;
-                object-fit: contain;
-            }
-            .camera-overlay {
-                position: absolute;
-                top: 12px;
-                left: 12px;
-                background: rgba(0, 0, 0, 0.55);
-                color: #fff;
-                padding: 10px 12px;
-                border-radius: 10px;
-                display: flex;
-                flex-direction: column;
-                gap: 4px;
-                box-shadow: 0 6px 14px rgba(0,0,0,0.25);
-            }
-            .camera-overlay .countdown-display {
-                color: #f5a524;
-                margin: 0;
-            }
-            .camera-overlay .status {
-                margin: 0;
-                color: #c9ddff;
-            }
-            .camera-error {
-                background: #f7f8fb;
-                color: #c0392b;
-                padding: 18px;
-                text-align: center;
-                border-radius: 14px;
-                border: 1px solid #f0d9d4;
-                box-shadow: 0 8px 18px rgba(31,42,61,0.05);
-            }
-            .info {
-                text-align: center;
-                margin-top: 16px;
-                color: #6b7280;
-                font-size: 0.95em;
-            }
-            .controls {
-                background: #ffffff;
-                padding: 18px 20px;
-                border-radius: 14px;
-                margin-top: 20px;
-                max-width: 640px;
-                margin-left: auto;
-                margin-right: auto;
-                border: 1px solid #e5e8ef;
-                box-shadow: 0 10px 22px rgba(31,42,61,0.08);
-            }
-            .controls h3 {
-                color: #f5a524;
-                margin-bottom: 12px;
-                display: flex;
-                align-items: center;
-                gap: 6px;
-                font-size: 1em;
-                font-weight: 700;
-            }
-            .controls p {
-                margin: 4px 0;
-                font-size: 0.95em;
-                color: #2f3a4d;
-            }
-            .button-group {
-                display: flex;
-                gap: 10px;
-                justify-content: center;
-                margin-top: 12px;
-                flex-wrap: wrap;
-            }
-            button {
-                padding: 10px 18px;
-                font-size: 0.95em;
-                border: 1px solid transparent;
-                border-radius: 8px;
-                cursor: pointer;
-                font-weight: 700;
-                transition: all 0.15s ease;
-            }
-            .btn-start {
-                background: #4d7cff;
-                color: #ffffff;
-                border-color: #4d7cff;
-            }
-            .btn-start:hover { background: #3c68e0; }
-            .btn-stop {
-                background: #ec5b56;
-                color: #ffffff;
-                border-color: #ec5b56;
-            }
-            .btn-stop:hover { background: #d64a46; }
-            .btn-reset {
-                background: #ffd24c;
-                color: #1f2a3d;
-                border-color: #ffd24c;
-            }
-            .btn-reset:hover { background: #f5c635; }
-            button:disabled {
-                opacity: 0.6;
-                cursor: not-allowed;
-            }
-            .input-group {
-                margin: 14px 0;
-                display: flex;
-                gap: 10px;
-                align-items: center;
-                justify-content: center;
-            }
-            .input-group input {
-                padding: 9px 10px;
-                font-size: 0.95em;
-                border: 1px solid #d6d9e2;
-                border-radius: 8px;
-                background: #fff;
-                color: #1f2a3d;
-                width: 90px;
-            }
-            .input-group label {
-                color: #4b5563;
-                font-size: 0.95em;
-            }
-        </style>
-    </head>
-    <body>
-        <div class="header">
-            <div class="logo-container">
-                <h1>Reachy Mini Countdown</h1>
-            </div>
-        </div>
-        __CAMERA_BLOCK__
-        <div class="info">
-            <p>Watch the robot countdown and celebrate!</p>
-        </div>
-        <div class="controls">
-            <h3>📋 Status</h3>
-            <p><strong>Camera:</strong> <span id="camera-status">__CAM_STATUS__</span></p>
-            <p><strong>Robot:</strong> <span id="robot-status">Connected</span></p>
-            
-            <h3>🎮 Controls</h3>
-            <div class="button-group">
-                <button class="btn-start" id="btn-start" onclick="startCountdown()">▶️ Start</button>
-                <button class="btn-stop" id="btn-stop" onclick="stopCountdown()" disabled>⏹️ Stop</button>
-                <button class="btn-reset" id="btn-reset" onclick="resetCountdown()">🔄 Reset</button>
-            </div>
-            
-            <div class="input-group">
-                <label for="countdown-seconds">Countdown (seconds):</label>
-                <input type="number" id="countdown-seconds" value="30" min="5" max="3600">
-                <button class="btn-start" onclick="startCustomCountdown()">Start Custom</button>
-            </div>
-            <div class="input-group" style="flex-direction: column; align-items: stretch; gap: 8px;">
-                <label for="youtube-url">Celebration YouTube URL:</label>
-                <input type="text" id="youtube-url" value="__YT_URL__" style="width: 100%; max-width: 480px;">
-                <div class="button-group" style="justify-content: flex-start;">
-                    <button class="btn-reset" onclick="setYoutube()">Save Music</button>
-                </div>
-            </div>
-            <div class="input-group">
-                <input type="checkbox" id="speak-intervals" __SPEAK_INTERVALS_CHECKED__ onchange="toggleSpeakIntervals()">
-                <label for="speak-intervals">Speak at 10-second intervals (60, 50, 40...)</label>
-            </div>
-        </div>
-        
-        <script>
-            function updateCountdown() {
-                fetch('/countdown')
-                    .then(r => r.json())
-                    .then(data => {
-                        const countdownEl = document.getElementById('countdown');
-                        const statusEl = document.getElementById('status');
-                        
-                        if (data.remaining <= 0) {
-                            countdownEl.textContent = '__EMOJI_TRIPLE__';
-                            statusEl.textContent = 'CELEBRATING!';
-                            statusEl.style.color = '#ffd700';
-                        } else if (data.remaining <= 10) {
-                            countdownEl.textContent = data.formatted;
-                            statusEl.textContent = '🔥 Final seconds!';
-                            statusEl.style.color = '#ff6b6b';
-                        } else if (data.remaining <= 60) {
-                            countdownEl.textContent = data.formatted;
-                            statusEl.textContent = '⏱️ Final minute!';
-                            statusEl.style.color = '#ffd700';
-                        } else {
-                            countdownEl.textContent = data.formatted;
-                            statusEl.textContent = 'Waiting for countdown...';
-                            statusEl.style.color = '#4ecdc4';
-                        }
-                    })
-                    .catch(e => console.error('Countdown update error:', e));
-            }
-            
-            // Update every second
-            setInterval(updateCountdown, 1000);
-            updateCountdown();
-            
-            // Control functions
-            function startCountdown() {
-                fetch('/control/start', {method: 'POST'})
-                    .then(r => r.json())
-                    .then(data => {
-                        if (data.success) {
-                            document.getElementById('btn-start').disabled = true;
-                            document.getElementById('btn-stop').disabled = false;
-                        }
-                    });
-            }
-            
-            function startCustomCountdown() {
-                const seconds = parseInt(document.getElementById('countdown-seconds').value);
-                if (seconds < 5 || seconds > 3600) {
-                    alert('Please enter a value between 5 and 3600 seconds');
-                    return;
-                }
-                fetch('/control/start', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({seconds: seconds})
-                })
-                .then(r => r.json())
-                .then(data => {
-                    if (data.success) {
-                        document.getElementById('btn-start').disabled = true;
-                        document.getElementById('btn-stop').disabled = false;
-                    }
-                });
-            }
-            
-            function stopCountdown() {
-                fetch('/control/stop', {method: 'POST'})
-                    .then(r => r.json())
-                    .then(data => {
-                        if (data.success) {
-                            document.getElementById('btn-start').disabled = false;
-                            document.getElementById('btn-stop').disabled = true;
-                        }
-                    });
-            }
-            
-            function resetCountdown() {
-                fetch('/control/reset', {method: 'POST'})
-                    .then(r => r.json())
-                    .then(data => {
-                        if (data.success) {
-                            document.getElementById('btn-start').disabled = false;
-                            document.getElementById('btn-stop').disabled = true;
-                        }
-                    });
-            }
-
-            function setYoutube() {
-                const url = document.getElementById('youtube-url').value.trim();
-                if (!url) {
-                    alert('Please enter a YouTube URL');
-                    return;
-                }
-                fetch('/control/music', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({url})
-                })
-                .then(r => r.json())
-                .then(data => {
-                    if (data.success) {
-                        alert('Music updated');
-                    } else {
-                        alert('Could not update music: ' + (data.error || 'unknown error'));
-                    }
-                })
-                .catch(() => alert('Network error while updating music'));
-            }
-            
-            function toggleSpeakIntervals() {
-                const checked = document.getElementById('speak-intervals').checked;
-                fetch('/control/speak-intervals', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({enabled: checked})
-                });
-            }
-            
-            // 🥚 Easter egg: Konami code detection
-            let konamiCode = [];
-            const konamiSequence = ['ArrowUp', 'ArrowUp', 'ArrowDown', 'ArrowDown', 
-                                   'ArrowLeft', 'ArrowRight', 'ArrowLeft', 'ArrowRight', 
-                                   'KeyB', 'KeyA'];
-            document.addEventListener('keydown', (e) => {
-                konamiCode.push(e.code);
-                if (konamiCode.length > konamiSequence.length) {
-                    konamiCode.shift();
-                }
-                if (konamiCode.join(',') === konamiSequence.join(',')) {
-                    fetch('/easter-egg/konami')
-                        .then(r => r.json())
-                        .then(data => {
-                            if (data.success) {
-                                alert('🥚 Easter Egg Activated! ' + data.message);
-                            }
-                        });
-                    konamiCode = [];
-                }
-            });
-        </script>
-    </body>
-    </html>
-    """
-    
-    # Build camera block depending on availability
-    if camera_available:
-        camera_block = """
-        <div class="camera-container">
-            <img id="camera" src="/video_feed" alt="Camera Feed" 
-                 onerror="this.style.display='none'; document.getElementById('camera-error').style.display='block';"
-                 onload="this.style.display='block'; document.getElementById('camera-error').style.display='none';">
-            <div class="camera-overlay">
-                <div class="countdown-display" id="countdown">--:--:--</div>
-                <div class="status" id="status">Initializing...</div>
-            </div>
-            <div id="camera-error" class="camera-error" style="display:none;">
-                <p>⚠️ Camera feed not available</p>
-                <p style="font-size:0.8em; margin-top:10px;">Make sure the robot camera is connected and permissions are granted.</p>
-            </div>
-        </div>
-        """
-        cam_status = "Active"
-    else:
-        camera_block = """
-        <div class="camera-container">
-            <div class="camera-overlay">
-                <div class="countdown-display" id="countdown">--:--:--</div>
-                <div class="status" id="status">Initializing...</div>
-            </div>
-            <div class="camera-error" style="display:block;">
-                <p>Camera disabled</p>
-                <p style="font-size:0.8em; margin-top:10px;">Running without camera stream.</p>
-            </div>
-        </div>
-        """
-        cam_status = "Disabled"
-    
-    # Inject emoji, music URL, and camera blocks into template
-    yt_value = control_state.get('youtube_url') or youtube_url or ""
-    speak_checked = "checked" if control_state.get('speak_intervals', True) else ""
-    templ = (
-        HTML_TEMPLATE
-        .replace("__EMOJI__", emoji)
-        .replace("__EMOJI_TRIPLE__", emoji * 3)
-        .replace("__YT_URL__", yt_value)
-        .replace("__CAMERA_BLOCK__", camera_block)
-        .replace("__CAM_STATUS__", cam_status)
-        .replace("__SPEAK_INTERVALS_CHECKED__", speak_checked)
-    )
+    # Render once - the page is static for the life of the process
+    with app.app_context():
+        index_html = render_template(
+            'index.html',
+            emoji=emoji,
+            yt_url=control_state.youtube_url or youtube_url or "",
+            camera_available=camera_available,
+            speak_intervals=control_state.speak_intervals,
+        )
+    index_gzip = gzip.compress(index_html.encode(), 6)
+    index_etag = hashlib.md5(index_html.encode()).hexdigest()
+    try:
+        import brotli
+        index_br: bytes | None = brotli.compress(index_html.encode())
+    except ImportError:
+        index_br = None
     
     @app.route('/')
     def index():
-        return render_template_string(templ)
+        # Quality values, so "br;q=0" opts out and "*" opts in
+        accept_encodings = request.accept_encodings
+        if index_br is not None and accept_encodings['br'] > 0:
+            resp = Response(index_br, mimetype='text/html')
+            resp.headers['Content-Encoding'] = 'br'
+            resp.set_etag(index_etag + '-br')
+        elif accept_encodings['gzip'] > 0:
+            resp = Response(index_gzip, mimetype='text/html')
+            resp.headers['Content-Encoding'] = 'gzip'
+            resp.set_etag(index_etag + '-gz')
+        else:
+            resp = Response(index_html, mimetype='text/html')
+            resp.set_etag(index_etag)
+        resp.headers['Vary'] = 'Accept-Encoding'
+        # Reloads revalidate and get a 304 while the server keeps running
+        resp.cache_control.no_cache = True
+        return resp.make_conditional(request)
     
     @app.route('/easter-egg/<secret>')
     def easter_egg(secret: str):
         """🥚 Secret easter egg endpoint - try 'konami' or '1337'"""
-        if secret.lower() in ['konami', '1337', 'secret', 'easter']:
-            control_state['easter_egg'] = True
-            return jsonify({
-                'success': True, 
-                'message': '🥚 Easter egg activated! Check the celebration!',
-                'hint': 'The robot will do something special next time it celebrates...'
-            })
-        return jsonify({'success': False, 'message': 'Not the right secret...'}), 404
+        if secret.lower() in _EASTER_EGG_SECRETS:
+            with control_state.lock:
+                control_state.easter_egg = True
+            return _EASTER_EGG_OK
+        return _EASTER_EGG_MISS
     
+    # (snapshot, running, line, etag, SSE event) for the last state served
+    countdown_cache: tuple = (None, None, b'', '', b'')
+
+    def countdown_line() -> tuple[bytes, str, bytes]:
+        """Current countdown state for /countdown and /events, as (line, ETag, SSE event).
+
+        A single `remaining|formatted|running|target` line rather than JSON:
+        the payload is tiny, sent every second to every client, and parsed
+        in the browser with one split(). It is built once per published
+        snapshot, however many clients ask for it.
+        """
+        nonlocal countdown_cache
+        snap = countdown_state.snapshot()
+        running = control_state.running
+        cached = countdown_cache
+        if snap is cached[0] and running == cached[1]:
+            return cached[2:]
+        remaining, formatted, target = snap
+        line = f"{remaining:.3f}|{formatted}|{running:d}|{target}\n".encode()
+        # The line already ends in one newline; one more ends the event
+        cached = (snap, running, line, hashlib.blake2b(line, digest_size=8).hexdigest(), b'data: ' + line + b'\n')
+        countdown_cache = cached
+        return cached[2:]
+
     @app.route('/countdown')
     def get_countdown():
-        """Return current countdown state as JSON."""
-        remaining = countdown_state.get('remaining', 0)
-        hours = int(remaining // 3600)
-        minutes = int((remaining % 3600) // 60)
-        seconds = int(remaining % 60)
-        formatted = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-        
-        return {
-            'remaining': remaining,
-            'formatted': formatted,
-            'target': countdown_state.get('target', ''),
-            'running': control_state.get('running', False)
-        }
+        """Return current countdown state as a `remaining|formatted|running|target` line."""
+        body, etag, _ = countdown_line()
+        # Unchanged state (e.g. while idle) is answered with 304 and no body
+        resp = Response(body, mimetype='text/plain')
+        resp.set_etag(etag)
+        resp.cache_control.no_cache = True
+        return resp.make_conditional(request)
+
+    stream_slots = threading.BoundedSemaphore(MAX_STREAMS)
+
+    def stream_response(body, **kwargs):
+        """Response for a never-ending stream, or 503 once every stream slot is taken."""
+        if not stream_slots.acquire(blocking=False):
+            return Response('Too many open streams\n', status=503, mimetype='text/plain',
+                            headers={'Retry-After': '5'})
+        return Response(StreamSlot(body, stream_slots), **kwargs)
+
+    @app.route('/events')
+    def countdown_events():
+        """Push countdown state as Server-Sent Events whenever it changes."""
+        def stream():
+            last = None
+            version = countdown_state.version
+            while not stop_event.is_set():
+                _, _, event = countdown_line()
+                if event != last:
+                    last = event
+                    yield event
+                # Woken by each published tick and by control commands; the
+                # timeout also catches running changes made by the countdown loop
+                seen, version = version, countdown_state.wait_changed(version, timeout=1.0)
+                if version == seen:
+                    # Comment line: a write to a closed client fails and frees the worker
+                    yield b': ping\n\n'
+
+        resp = stream_response(stream(), mimetype='text/event-stream')
+        resp.cache_control.no_cache = True
+        return resp
 
     @app.route('/control/music', methods=['POST'])
     def set_music():
@@ -1181,47 +1551,70 @@ def _start_camera_ui(
             data = request.get_json() or {}
             url = data.get('url')
             if not url or not isinstance(url, str):
-                return jsonify({'success': False, 'error': 'Invalid URL'}), 400
-            control_state['youtube_url'] = url
-            return jsonify({'success': True, 'message': 'Music updated', 'url': url})
+                return _json_response({'success': False, 'error': 'Invalid URL'}, 400)
+            with control_state.lock:
+                control_state.youtube_url = url
+            return _json_response({'success': True, 'message': 'Music updated', 'url': url})
         except Exception as e:
-            return jsonify({'success': False, 'error': str(e)}), 500
+            return _json_response({'success': False, 'error': str(e)}, 500)
     
-    @app.route('/control/start', methods=['POST'])
-    def start_countdown():
-        """Start a new countdown."""
-        try:
-            data = request.get_json() or {}
-            seconds = data.get('seconds', 30)
-            
-            control_state['action'] = 'start'
-            control_state['seconds'] = seconds
-            control_state['running'] = True
-            
-            return jsonify({'success': True, 'message': f'Starting {seconds} second countdown'})
-        except Exception as e:
-            return jsonify({'success': False, 'error': str(e)}), 500
-    
-    @app.route('/control/stop', methods=['POST'])
-    def stop_countdown():
-        """Stop the current countdown."""
-        try:
-            control_state['action'] = 'stop'
-            control_state['running'] = False
-            return jsonify({'success': True, 'message': 'Countdown stopped'})
-        except Exception as e:
-            return jsonify({'success': False, 'error': str(e)}), 500
-    
-    @app.route('/control/reset', methods=['POST'])
-    def reset_countdown():
-        """Reset the countdown."""
+    control_commands = {'start': Command.START, 'stop': Command.STOP, 'reset': Command.RESET}
+
+    def parse_control(cmd) -> tuple[Command, int | None]:
+        """Validate one {cmd, seconds?} control command; raises ValueError."""
+        name = cmd.get('cmd') if isinstance(cmd, dict) else None
+        action = control_commands.get(name) if isinstance(name, str) else None
+        if action is None:
+            raise ValueError(f"Unknown command: {cmd!r}")
+        if action is not Command.START:
+            return action, None
+        seconds = cmd.get('seconds', 30)
+        # bool is an int subclass, but "seconds": true is not a duration
+        if type(seconds) is not int or not COUNTDOWN_SECONDS_MIN <= seconds <= COUNTDOWN_SECONDS_MAX:
+            raise ValueError(
+                f"seconds must be an integer from {COUNTDOWN_SECONDS_MIN} to {COUNTDOWN_SECONDS_MAX}"
+            )
+        return action, seconds
+
+    def apply_control(action: Command, seconds: int | None) -> str:
+        """Apply one validated control command and describe it."""
+        with control_state.lock:
+            if action is Command.START:
+                control_state.seconds = seconds
+                control_state.running = True
+            else:
+                control_state.running = False
+        if action is Command.RESET:
+            countdown_state.update(remaining=0)
+        if post_command is not None:
+            post_command(action, seconds)
+        if action is Command.START:
+            return f'Starting {seconds} second countdown'
+        return _CONTROL_MESSAGES[action]
+
+    @app.route('/control', methods=['POST'])
+    def control():
+        """Start, stop or reset the countdown.
+
+        Accepts one {"cmd": "start"|"stop"|"reset", "seconds": N} object or
+        a list of them, applied in order (e.g. stop then start in one request).
+        Every command is validated first, so a bad batch changes nothing.
+        """
         try:
-            control_state['action'] = 'reset'
-            control_state['running'] = False
-            countdown_state['remaining'] = 0
-            return jsonify({'success': True, 'message': 'Countdown reset'})
+            data = request.get_json(silent=True) or {}
+            cmds = data if isinstance(data, list) else [data]
+            parsed = [parse_control(cmd) for cmd in cmds]
+            try:
+                messages = [apply_control(action, seconds) for action, seconds in parsed]
+            finally:
+                countdown_state.notify()
+            if len(parsed) == 1 and parsed[0][0] in _CONTROL_OK:
+                return _CONTROL_OK[parsed[0][0]]
+            return _json_response({'success': True, 'message': '; '.join(messages), 'applied': len(messages)})
+        except ValueError as e:
+            return _json_response({'success': False, 'error': str(e)}, 400)
         except Exception as e:
-            return jsonify({'success': False, 'error': str(e)}), 500
+            return _json_response({'success': False, 'error': str(e)}, 500)
     
     @app.route('/control/speak-intervals', methods=['POST'])
     def set_speak_intervals():
@@ -1229,92 +1622,204 @@ def _start_camera_ui(
         try:
             data = request.get_json() or {}
             enabled = data.get('enabled', False)
-            control_state['speak_intervals'] = enabled
-            return jsonify({'success': True, 'enabled': enabled})
+            with control_state.lock:
+                control_state.speak_intervals = enabled
+            return _json_response({'success': True, 'enabled': enabled})
         except Exception as e:
-            return jsonify({'success': False, 'error': str(e)}), 500
+            return _json_response({'success': False, 'error': str(e)}, 500)
     
+    broker = FrameBroker()
+
     def generate_frames():
-        """Generate camera frames as JPEG stream and optionally record video."""
+        """Generate the MJPEG stream for one client from the shared broker."""
         # Check if camera is available
         if reachy_mini.media.camera is None:
-            # Generate a placeholder frame
-            placeholder = np.zeros((480, 640, 3), dtype=np.uint8)
-            cv2.putText(placeholder, "Camera not available", (120, 240), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
-            cv2.putText(placeholder, "(Headless simulation mode)", (140, 280), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, (150, 150, 150), 1)
-            ret, buffer = cv2.imencode('.jpg', placeholder)
-            if ret:
-                frame_bytes = buffer.tobytes()
+            # Same pre-built placeholder part for every client, one chunk per update
+            if _PLACEHOLDER_PART is not None:
                 while not stop_event.is_set():
-                    yield (b'--frame\r\n'
-                           b'Content-Type: image/jpeg\r\n\r\n' + frame_bytes + b'\r\n')
-                    time.sleep(1)  # Slow update for placeholder
+                    yield _PLACEHOLDER_PART
+                    stop_event.wait(1)  # Slow update for placeholder
             return
             
+        start_capture()
+        quality = AdaptiveQuality()
+        for header, frame_bytes in broker.frames(stop_event, quality):
+            sent = time.monotonic()
+            # Shared header, JPEG and trailer as separate chunks: nothing is
+            # built or copied per client
+            yield header
+            yield frame_bytes
+            yield _MJPEG_TRAILER
+            quality.record(time.monotonic() - sent)
+
+    def capture_frames():
+        """Grab and encode frames once for all viewers, and optionally record video."""
+        _place_worker_thread(capture=True)
+        # Preallocated slots for frames handed to the recorder; the ring is
+        # larger than the queue so a slot is never reused while still queued
+        record_ring: np.ndarray | None = None
+        record_slot = 0
+        record_dropped = 0
+        frame_interval = 1 / CAPTURE_FPS
+        next_frame = time.monotonic()
+        # Camera failures back off exponentially and are logged at most once a second
+        error_backoff = CAMERA_ERROR_BACKOFF_MIN
+        last_error_log = 0.0
         while not stop_event.is_set():
             try:
                 frame = reachy_mini.media.get_frame()
                 if frame is not None:
-                    # Record to video file if enabled
-                    if record_video and video_writer is not None:
-                        video_writer.write(frame)
+                    error_backoff = CAMERA_ERROR_BACKOFF_MIN
+                    # Hand off to the recorder; drop the frame rather than stall capture
+                    if record_video and video_writer is not None and record_queue.full():
+                        record_dropped += 1
+                    elif record_video and video_writer is not None:
+                        if record_ring is None or record_ring.shape[1:] != frame.shape:
+                            record_ring = np.empty((RECORD_RING_SIZE, *frame.shape), dtype=frame.dtype)
+                        slot = record_ring[record_slot]
+                        np.copyto(slot, frame)
+                        record_slot = (record_slot + 1) % RECORD_RING_SIZE
+                        record_queue.put_nowait(slot)
                     
-                    # Stream to web UI
-                    ret, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 85])
-                    if ret:
-                        frame_bytes = buffer.tobytes()
-                        yield (b'--frame\r\n'
-                               b'Content-Type: image/jpeg\r\n\r\n' + frame_bytes + b'\r\n')
-                time.sleep(0.033)  # ~30 FPS
+                    # Encode once, shared by every /video_feed client
+                    jpeg = _encode_jpeg(frame)
+                    if jpeg is not None:
+                        broker.publish(frame, jpeg)
+                # Pace to a fixed frame clock so capture + encode time is
+                # absorbed; after an overrun, start again from now (drop frames)
+                next_frame += frame_interval
+                delay = next_frame - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    next_frame = time.monotonic()
             except Exception as e:
-                print(f"Camera frame error: {e}")
-                time.sleep(0.1)
+                now = time.monotonic()
+                if now - last_error_log > 1.0:
+                    print(f"Camera frame error: {e}")
+                    last_error_log = now
+                stop_event.wait(error_backoff)
+                error_backoff = min(error_backoff * 2, CAMERA_ERROR_BACKOFF_MAX)
+                next_frame = time.monotonic()
+        broker.close()
         
-        # Clean up video writer
+        # Flush the recorder and clean up video writer
         if video_writer is not None:
+            record_queue.put(None)
+            record_thread.join()
             video_writer.release()
             print(f"✅ Video saved to: {video_filename}")
+            if video_writer_copy is not None:
+                video_writer_copy.release()
+                print(f"✅ Video copy saved to: {video_copy_filename}")
+            if record_dropped:
+                print(f"⚠️ {record_dropped} frames dropped while the recorder was behind")
+
+    # Video encoding runs on its own thread, fed by a small bounded queue
+    record_queue: queue.Queue = queue.Queue(maxsize=RECORD_QUEUE_SIZE)
+
+    def record_frames():
+        """Write queued frames to the video file until a None sentinel arrives."""
+        _place_worker_thread(capture=False)
+        writers = [w for w in (video_writer, video_writer_copy) if w is not None]
+        repeat = RECORD_LEAD_IN_FRAMES
+        skip = 0
+        while True:
+            frame = record_queue.get()
+            if frame is None:
+                break
+            if skip:
+                # Already covered by the lead-in copies of the first frame
+                skip -= 1
+                continue
+            for _ in range(repeat):
+                for writer in writers:
+                    writer.write(frame)
+            skip, repeat = repeat - 1, 1
+
+    record_thread = threading.Thread(target=record_frames, daemon=True)
+
+    capture_lock = threading.Lock()
+    capture_thread: threading.Thread | None = None
+
+    def start_capture():
+        """Start the shared capture thread on first use."""
+        nonlocal capture_thread
+        with capture_lock:
+            if capture_thread is None:
+                capture_thread = threading.Thread(target=capture_frames, daemon=True)
+                capture_thread.start()
     
     @app.route('/video_feed')
     def video_feed():
         """Stream camera feed as MJPEG."""
-        return Response(
+        return stream_response(
             generate_frames(),
-            mimetype='multipart/x-mixed-replace; boundary=frame'
+            mimetype='multipart/x-mixed-replace; boundary=frame',
+            direct_passthrough=True,
         )
     
     @app.route('/camera/test')
     def camera_test():
         """Test endpoint to check if camera is working."""
+        # Reuse the shared capture's latest frame instead of reading the camera again
+        with broker.cond:
+            latest = broker.jpeg
+        if latest is not None:
+            return Response(latest, mimetype='image/jpeg')
         try:
             frame = reachy_mini.media.get_frame()
             if frame is not None:
-                ret, buffer = cv2.imencode('.jpg', frame)
-                if ret:
-                    from flask import send_file
-                    import io
-                    return send_file(
-                        io.BytesIO(buffer.tobytes()),
-                        mimetype='image/jpeg'
-                    )
-            return jsonify({'error': 'No frame available'}), 404
+                jpeg = _encode_jpeg(frame)
+                if jpeg is not None:
+                    return Response(jpeg, mimetype='image/jpeg')
+            return _json_response({'error': 'No frame available'}, 404)
         except Exception as e:
-            return jsonify({'error': str(e)}), 500
+            return _json_response({'error': str(e)}, 500)
     
+    # Recording must not depend on someone watching the stream
+    if record_video and video_writer is not None:
+        record_thread.start()
+        start_capture()
+
     try:
-        local_url = f"http://127.0.0.1:{port}" if host == "0.0.0.0" else f"http://{host}:{port}"
-        print(f"📹 Camera UI starting at {local_url}")
+        print(f"📹 Camera UI starting at {ui_url or _format_url(host, port)}")
         if record_video:
             print(f"🎥 Video recording enabled: {video_filename}")
-        app.run(host=host, port=port, debug=False, use_reloader=False)
+        serve = None
+        if os.environ.get('FLASK_ENV') != 'development':
+            try:
+                from waitress import serve
+            except ImportError:
+                pass
+        if serve is not None:
+            # Production WSGI server: one thread per allowed stream plus a
+            # reserve, so the page and control routes still get a worker
+            # when MAX_STREAMS streams are open, with a cap on open
+            # connections. poll() instead of select() keeps the event loop
+            # free of the FD_SETSIZE limit.
+            serve(app, host=host, port=port, threads=MAX_STREAMS + SHORT_REQUEST_THREADS,
+                  connection_limit=256, channel_timeout=300,
+                  outbuf_high_watermark=STREAM_OUTBUF_HIGH_WATERMARK,
+                  asyncore_use_poll=True)
+        else:
+            # The dev server speaks HTTP/1.0 by default and closes the socket
+            # after every response; HTTP/1.1 lets polls reuse the connection
+            from werkzeug.serving import WSGIRequestHandler
+
+            class KeepAliveRequestHandler(WSGIRequestHandler):
+                protocol_version = 'HTTP/1.1'
+
+            app.run(host=host, port=port, debug=False, use_reloader=False, threaded=True,
+                    request_handler=KeepAliveRequestHandler)
     except Exception as e:
         print(f"Camera UI error: {e}")
     finally:
-        # Ensure video writer is closed
+        # Ensure video writers are closed
         if video_writer is not None:
             video_writer.release()
+        if video_writer_copy is not None:
+            video_writer_copy.release()
 
 
 def main() -> None:
@@ -1331,20 +1836,10 @@ def main() -> None:
     localhost_only = not args.wireless
 
     stop_event = threading.Event()
-    countdown_state = {'remaining': 0, 'target': ''}
-    control_state = {
-        'action': None,
-        'running': False,
-        'seconds': 30,
-        'youtube_url': None,
-        'speak_intervals': args.speak_intervals,
-    }
+    countdown_state = CountdownState()
+    control_state = ControlState(speak_intervals=args.speak_intervals)
     
-    # Determine the URL for the web UI
-    if args.host == "0.0.0.0" or args.host == "127.0.0.1":
-        ui_url = f"http://127.0.0.1:{args.port}"
-    else:
-        ui_url = f"http://{args.host}:{args.port}"
+    ui_url = _format_url(args.host, args.port)
     
     try:
         # Increase connection timeout for daemon startup
@@ -1361,7 +1856,7 @@ def main() -> None:
             # Override YouTube URL if provided
             if args.youtube_url is not None:
                 app_instance.AULD_LANG_SYNE_URL = args.youtube_url
-            control_state['youtube_url'] = app_instance.AULD_LANG_SYNE_URL
+            control_state.youtube_url = app_instance.AULD_LANG_SYNE_URL
             app_instance.custom_app_url = ui_url  # Set the URL dynamically
             app_instance._countdown_state = countdown_state  # Share state
             app_instance._control_state = control_state  # Share control state
@@ -1377,9 +1872,12 @@ def main() -> None:
                     "host": args.host,
                     "record_video": args.record,
                     "video_filename": args.video_output,
+                    "robust_record": args.robust_record,
                     "emoji": args.emoji,
                     "camera_available": camera_available,
                     "youtube_url": app_instance.AULD_LANG_SYNE_URL,
+                    "post_command": app_instance.post_command,
+                    "ui_url": ui_url,
                 },
                 daemon=True
             )